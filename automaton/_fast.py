@@ -0,0 +1,40 @@
+# 3rd-party packages
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit when numba isn't installed. The decorated
+        function is just run as plain python.
+        """
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True, boundscheck=False)
+def walk(delta: np.ndarray, start: int, syms: np.ndarray) -> int:
+    """
+    Runs a sequence of symbol indices through a dense transition table.
+
+    :param      delta:  (num_states x num_symbols) int array containing the
+                        index of the destination state under each symbol index
+                        at each state's index. -1 if there is no transition.
+    :param      start:  The index of the state to start the walk from
+    :param      syms:   The sequence of symbol indices to walk
+
+    :returns:   The index of the state the walk ends in. -1 if the walk
+                reached a state with no transition under the next symbol.
+    """
+
+    s = start
+    for k in syms:
+        s = delta[s, k]
+        if s < 0:
+            return -1
+
+    return s
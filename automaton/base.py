@@ -1,23 +1,20 @@
+from __future__ import annotations
+
 # 3rd-party packages
-import graphviz as gv
 import networkx as nx
 import numpy as np
 import matplotlib.pyplot as plt
-import collections
 import multiprocessing
 import warnings
 import os
-import copy
 import queue
 from pathlib import Path
+from functools import lru_cache
 from numpy.random import RandomState
 from joblib import Parallel, delayed
 from abc import ABCMeta, abstractmethod
-from scipy.stats import rv_discrete
-from networkx.drawing.nx_pydot import to_pydot
-from IPython.display import display, Image
-from pydot import Dot
-from typing import Dict, Hashable, Iterable, Tuple, List
+from typing import (Dict, Hashable, Iterable, Tuple, List, Callable,
+                    TYPE_CHECKING)
 from bidict import bidict
 
 # local packages / modules
@@ -28,15 +25,133 @@ from .types import (NXNodeList, NXEdgeList, Node, Observation, Symbol,
 from .mps import (BMPS_exact, SWDFA_MPS, should_use_BMPS_exact,
                   postprocess_MPS, MPSReturnData)
 
+# the drawing packages and numba (pulled in by ._fast) are slow to import and
+# only needed by a few methods, so they are imported where they're used
+if TYPE_CHECKING:
+    from pydot import Dot
+
 # needed for multi-threaded sampling routine
 NUM_CORES = multiprocessing.cpu_count()
 
 # constants
 SMOOTHING_AMOUNT = 0.0001
+MAX_SPECIALIZED_STEP_ALPHABET_SIZE = 8
 DEFAULT_FINAL_TRANS_SYMBOL = '$'
 DEFAULT_EMPTY_TRANS_SYMBOL = 'lambda'
 
 
+class _Categorical(object):
+    """
+    A minimal categorical distribution over integer symbol indices.
+
+    Drop-in replacement for the scipy.stats.rv_discrete objects used as
+    each state's transition distribution. Sampling is just a searchsorted
+    against the pre-computed cdf, so we skip all of scipy's generic
+    rv_discrete machinery on every draw.
+
+    int64 edge_symbols already in ascending order and float64 edge_probs are
+    kept without copying them, so they shouldn't be modified afterwards.
+
+    :param      edge_symbols:  The integer symbol index of each transition
+    :param      edge_probs:    The probability of each transition
+    :param      cdf_dtype:     The floating point dtype to store the cdf
+                               with. Sampling only compares the cdf against
+                               a uniform draw, so this can be lower precision
+                               than the pmf.
+
+    :raises     ValueError:    edge_symbols and edge_probs must have the same
+                               shape
+    :raises     ValueError:    edge_probs must sum to 1
+    """
+
+    def __init__(self, edge_symbols: Symbols,
+                 edge_probs: Probabilities,
+                 cdf_dtype: type = np.float64) -> '_Categorical':
+
+        edge_symbols = np.asarray(edge_symbols, dtype=np.int64)
+        edge_probs = np.asarray(edge_probs, dtype=np.float64)
+
+        if edge_symbols.shape != edge_probs.shape:
+            msg = 'edge_symbols and edge_probs must have the same shape.'
+            raise ValueError(msg)
+
+        # keep the symbols sorted, just like rv_discrete did, so anything
+        # iterating over the distribution sees the same transition order.
+        # Already sorted arrays are kept as is, without a copy.
+        if not np.all(edge_symbols[:-1] <= edge_symbols[1:]):
+            sorted_idxs = np.argsort(edge_symbols)
+            edge_symbols = edge_symbols[sorted_idxs]
+            edge_probs = edge_probs[sorted_idxs]
+
+        self.xk = edge_symbols
+        """integer symbol index of each transition"""
+
+        self.pk = edge_probs
+        """the probability of each transition"""
+
+        if not np.allclose(np.sum(self.pk), 1):
+            msg = f'The sum of provided edge_probs ({self.pk}) is not 1.'
+            raise ValueError(msg)
+
+        # accumulate at full precision and only then quantize, so the
+        # round-off doesn't compound along the cdf
+        self.cdf = np.cumsum(self.pk).astype(cdf_dtype)
+        """the cumulative distribution over the transitions"""
+
+        self._max_sample_idx = np.flatnonzero(self.pk > 0)[-1]
+        """index of the last transition with nonzero probability. Round-off
+           can only overshoot the cdf into zero probability transitions."""
+
+        self.random_state = None
+        """the np.random.RandomState to sample with. If None, samples
+           using the global numpy random state"""
+
+    def rvs(self, size: int = 1,
+            random_state: {None, RandomState}=None) -> np.ndarray:
+        """
+        Draws random symbol indices from the distribution
+
+        :param      size:          The number of samples to draw
+        :param      random_state:  The np.random.RandomState to sample with.
+                                   Defaults to self.random_state.
+
+        :returns:   (size,) array of sampled symbol indices
+        """
+
+        if random_state is None:
+            random_state = self.random_state
+
+        if random_state is None:
+            u = np.random.random_sample(size)
+        else:
+            u = random_state.random_sample(size)
+
+        # searchsorted would upcast a reduced precision cdf to u's float64 on
+        # every draw, so compare in the cdf's dtype instead
+        u = u.astype(self.cdf.dtype, copy=False)
+
+        # round-off can leave cdf[-1] slightly below 1, so we need to clip.
+        # Clipping to the last possible transition (rather than the last
+        # transition) means a zero probability symbol is never drawn.
+        sampled_idxs = np.searchsorted(self.cdf, u, side='right')
+        np.minimum(sampled_idxs, self._max_sample_idx, out=sampled_idxs)
+
+        return self.xk[sampled_idxs]
+
+    def pmf(self, k: {int, Symbols}) -> np.ndarray:
+        """
+        Evaluates the probability mass function at the given symbol indices
+
+        :param      k:    The symbol index(es) to evaluate
+
+        :returns:   the probability of each symbol index in k
+        """
+
+        k = np.atleast_1d(k)
+
+        return (k[:, np.newaxis] == self.xk[np.newaxis, :]) @ self.pk
+
+
 class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
     """
     This class describes a automaton with (possibly) stochastic transitions
@@ -46,11 +161,13 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
     Node Attributes
     -----------------
         - final_probability: final state probability for the node
-        - trans_distribution: a sampled-able function to select the next state
-          and emitted symbol
         - is_accepting: a boolean flag determining whether the automaton
           considers the node accepting
 
+    Each state's sampleable transition distribution (a function to select
+    the next state and emitted symbol) is kept outside of the node data, see
+    transition_dist().
+
     Edge Properties
     -----------------
         - symbol: the symbol value emitted when the edge is traversed
@@ -124,6 +241,13 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
                                            display of the automaton
     :param      smoothing_amount:          probability mass to re-assign to
                                            unseen symbols at each node
+    :param      prob_dtype:                The floating point dtype used to
+                                           store the sampling cdfs. np.float16
+                                           can be used for very large
+                                           automata where memory matters.
+
+    :raises     ValueError:                prob_dtype must be a floating
+                                           point dtype
     """
 
     # file I/O
@@ -150,7 +274,8 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
                  can_have_accepting_nodes: bool = True,
                  merge_sinks: bool = False,
                  edge_weight_key: str = None,
-                 smoothing_amount: float = SMOOTHING_AMOUNT) -> 'Automaton':
+                 smoothing_amount: float = SMOOTHING_AMOUNT,
+                 prob_dtype: type = np.float32) -> 'Automaton':
 
         self._transition_map = dict()
         """a map of start state label and symbol to destination state"""
@@ -163,6 +288,21 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         """bidirectional mapping from symbol labels to an int index in
            transition dists."""
 
+        self._sym2idx = dict(symbol_display_map)
+        """plain dict snapshot of the symbol display map. Looking up symbol
+           indices in a native dict is cheaper than going through bidict."""
+
+        self._all_symbol_idxs = np.fromiter(symbol_display_map.inv.keys(),
+                                            dtype=np.int64)
+        """array of every symbol index in the symbol display map"""
+
+        self._inv_symbol_array = np.empty(self._all_symbol_idxs.max() + 1,
+                                          dtype=object)
+        """array of each displayable symbol, located at its (integer)
+           symbol index. Allows converting symbol indices in bulk."""
+        for symbol_idx, symbol in symbol_display_map.inv.items():
+            self._inv_symbol_array[symbol_idx] = symbol
+
         self.alphabet_size = alphabet_size
         """number of symbols in automaton alphabet"""
 
@@ -190,6 +330,13 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         self._smoothing_amount = smoothing_amount
         """probability mass to re-assign to unseen symbols at each node"""
 
+        if np.dtype(prob_dtype).kind != 'f':
+            msg = f'prob_dtype ({prob_dtype}) must be a floating point dtype'
+            raise ValueError(msg)
+
+        self._prob_dtype = np.dtype(prob_dtype)
+        """floating point dtype used to store the sampling cdfs"""
+
         self.is_sampleable = is_sampleable
         """transitions will have pre-computed, well-formed distributions"""
 
@@ -228,6 +375,50 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         """a (num_states x 1) ndarray containing the pmf for terminating
            at each state's index."""
 
+        self._delta: np.ndarray
+        """a (num_states x num_symbols) int array containing the index of
+           the destination state under each symbol index at each state's
+           index. -1 if there is no transition defined."""
+
+        self._cdf: np.ndarray
+        """a (num_states x num_symbols) ndarray containing the cumulative
+           transition distribution over the symbol indices at each state's
+           index, stored as self._prob_dtype. Only filled in if
+           is_sampleable."""
+
+        self._pmf: np.ndarray
+        """a (num_states x num_symbols) float64 ndarray containing the
+           transition probability of each symbol index at each state's
+           index. Only filled in if is_sampleable."""
+
+        self._max_symbol_idxs: np.ndarray
+        """a (num_states,) array of the last symbol index with nonzero
+           probability at each state's index"""
+
+        self._accept: np.ndarray
+        """a (num_states,) uint8 array, 1 at the index of each accepting
+           state and 0 otherwise"""
+
+        self._dists: list
+        """the transition distribution of each state, located at the state's
+           index. All None if not is_sampleable."""
+
+        self._indptr: np.ndarray
+        """(num_states + 1) int array of offsets into the flat edge arrays.
+           The outgoing edges of the state at index i are the entries in
+           [self._indptr[i], self._indptr[i + 1]) of the edge arrays."""
+
+        self._col: np.ndarray
+        """flat int array of each edge's destination state index"""
+
+        self._esym: np.ndarray
+        """flat int array of each edge's symbol index"""
+
+        self._eprob: np.ndarray
+        """flat array of each edge's probability. An edge without a
+           probability is stored as 1.0, and one whose probability is
+           explicitly None is stored as nan."""
+
         self._automata_display_dir = os.path.join(
             self.automata_data_dir,
             self.automata_display_data_dir_name)
@@ -248,6 +439,33 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
             edge_weight_key=edge_weight_key,
             merge_sinks=merge_sinks)
 
+    def __getstate__(self) -> dict:
+        """
+        Gets the automaton's attributes to pickle / copy.
+
+        The specialized step() is a closure, which can't be pickled, so it is
+        left out and rebuilt by __setstate__.
+
+        :returns:   the automaton's attribute dict, without any specialized
+                    step()
+        """
+
+        state = self.__dict__.copy()
+        state.pop('step', None)
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the automaton's pickled / copied attributes, rebuilding the
+        specialized step() if it had one.
+
+        :param      state:  The attribute dict from __getstate__
+        """
+
+        self.__dict__.update(state)
+        self._specialize_step()
+
     def disp_edges(self, graph: {None, nx.MultiDiGraph}=None) -> None:
         """
         Prints each edge in the graph in an edge-list tuple format
@@ -288,6 +506,9 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         :param      filename:  The filename to save the automaton image
         """
 
+        import graphviz as gv
+        from IPython.display import display, Image
+
         graph = self._get_pydot_representation()
 
         if filename:
@@ -311,7 +532,7 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         :type       curr_state:  Hashable
         """
 
-        trans_dist = self._get_node_data(curr_state, 'trans_distribution')
+        trans_dist = self.transition_dist(self._node_index_map[curr_state])
         symbols = self._convert_symbol_idxs(trans_dist.xk)
 
         fig, ax = plt.subplots(1, 1)
@@ -546,6 +767,101 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
 
         return sampled_trace, length_of_trace, trace_prob
 
+    def generate_batch(self, num_samples: int, N: int,
+                       random_state: {None, int, Iterable}=None
+                       ) -> GeneratedTraceData:
+        """
+        generates num_samples random traces from the automaton's start state,
+        sampling all of the traces in parallel.
+
+        Each step of the batch is vectorized over the dense transition
+        tables (self._cdf, self._delta), so this is much faster than
+        generate_traces for large numbers of samples. However, traces are not
+        resampled: any trace that hasn't terminated after N symbols is
+        returned as is, with a probability of 0.
+
+        :param      num_samples:   The number of trace samples to generate
+        :param      N:             maximum length of trace
+        :param      random_state:  The np.random.RandomState() seed parameter
+                                   for sampling. Defaulting to None causes the
+                                   seed to reset.
+
+        :returns:   list of sampled traces, list of the associated trace
+                    lengths, list of the associated trace probabilities
+
+        :raises     ValueError:    if you try to generate traces from a
+                                   non-sampleable automaton
+        """
+
+        if not self.is_sampleable:
+            msg = 'Cannot generate traces in a non-sampleable automaton'
+            raise ValueError(msg)
+
+        num_samples = int(num_samples)
+        random_state = RandomState(random_state)
+
+        cdf = self._cdf
+        # the cdf may be stored at reduced precision, so the trace
+        # probabilities come from the full precision pmf instead
+        pmf = self._pmf
+        max_symbol_idxs = self._max_symbol_idxs
+        final_sym = self.final_transition_sym
+        final_trans_symbol_idx = self._symbol_display_map[final_sym]
+
+        start_state_idx = self._node_index_map[self.start_state]
+        states = np.full(num_samples, start_state_idx)
+        sampled_symbols = np.empty((num_samples, N), dtype=np.int64)
+        trace_lengths = np.zeros(num_samples, dtype=np.int64)
+        trace_probs = np.ones(num_samples)
+
+        # indices of the traces that have not yet terminated
+        active = np.arange(num_samples)
+
+        for t in range(N):
+            if active.size == 0:
+                break
+
+            curr_states = states[active]
+            # drawn in the cdf's dtype so the comparison doesn't upcast the
+            # gathered cdf rows to float64
+            u = random_state.random_sample(active.size).astype(cdf.dtype,
+                                                               copy=False)
+
+            # counting the cdf entries <= u is the same as a searchsorted on
+            # each row, and skips over any zero probability symbols
+            symbols = (cdf[curr_states] <= u[:, np.newaxis]).sum(axis=1)
+            np.minimum(symbols, max_symbol_idxs[curr_states], out=symbols)
+            trace_probs[active] *= pmf[curr_states, symbols]
+
+            hasnt_terminated = symbols != final_trans_symbol_idx
+            active = active[hasnt_terminated]
+            curr_states = curr_states[hasnt_terminated]
+            symbols = symbols[hasnt_terminated]
+
+            next_states = self._delta[curr_states, symbols]
+            if (next_states < 0).any():
+                bad_trans_idx = np.flatnonzero(next_states < 0)[0]
+                bad_state_idx = curr_states[bad_trans_idx]
+                bad_symbol_idx = symbols[bad_trans_idx]
+                msg = f'sampled symbol ' + \
+                      f'({self._convert_symbol_idxs(bad_symbol_idx)}) ' + \
+                      f'has no transition defined from state ' + \
+                      f'({self._node_index_map.inv[bad_state_idx]})'
+                raise ValueError(msg)
+
+            sampled_symbols[active, t] = symbols
+            trace_lengths[active] += 1
+            states[active] = next_states
+
+        # these traces hit the max trace length limit without terminating
+        trace_probs[active] = 0.0
+
+        samples = [self._convert_symbol_idxs(trace[:trace_length].tolist())
+                   for trace, trace_length in zip(sampled_symbols,
+                                                  trace_lengths)]
+
+        return samples, trace_lengths.tolist(), trace_probs.tolist()
+
     def observe(self, curr_state: Node) -> Observation:
         """
         Returns the given state's observation symbol
@@ -778,8 +1094,8 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         empty_sym_idx = self._symbol_display_map[empty_symbol]
 
         # numba pre-processing
-        symbol_idxs = [self._symbol_display_map[symbol]
-                       for symbol in symbols]
+        sym2idx = self._sym2idx
+        symbol_idxs = [sym2idx[symbol] for symbol in symbols]
 
         trans_mat_dict = self._transition_matrices
         num_states = self.num_states
@@ -862,7 +1178,7 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
                     states, the probability of this transition occurring
         """
 
-        trans_dist = self._get_node_data(curr_state, 'trans_distribution')
+        trans_dist = self.transition_dist(self._node_index_map[curr_state])
 
         # critical step for use with parallelized libraries. This must be reset
         # before sampling, as otherwise each of the threads is using the same
@@ -922,6 +1238,125 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
 
         return next_state, symbol_probability
 
+    def step(self, state_idx: int, symbol_idx: int) -> int:
+        """
+        Gets the next state's index given the current state's index and the
+        "input" symbol's index, using the dense transition table.
+
+        :param      state_idx:   The current state's index in
+                                 self._node_index_map
+        :param      symbol_idx:  The input symbol's index in
+                                 self._symbol_display_map
+
+        :returns:   The next state's index. -1 if there is no transition
+                    defined under symbol_idx at state_idx.
+        """
+
+        return int(self._delta[state_idx, symbol_idx])
+
+    def transition_dist(self, state_idx: int) -> _Categorical:
+        """
+        Gets the transition distribution of the state at the given index.
+
+        :param      state_idx:  The state's index in self._node_index_map
+
+        :returns:   The state's distribution over the next symbol index
+
+        :raises     TypeError:  the automaton is not sampleable, so there are
+                                no transition distributions
+        """
+
+        if not self.is_sampleable:
+            msg = 'automaton is not sampleable and thus does not have ' + \
+                  'transition distributions'
+            raise TypeError(msg)
+
+        return self._dists[state_idx]
+
+    def _make_specialized_step(self) -> Callable[[int, int], int]:
+        """
+        Makes a version of step() with the current dense transition table
+        baked into it as nested tuples.
+
+        For small alphabets, indexing the nested tuples is cheaper than
+        indexing into the 2D self._delta array on every call.
+
+        :returns:   a function with the same signature and behavior as step()
+        """
+
+        def step(state_idx: int, symbol_idx: int,
+                 _delta: tuple = tuple(map(tuple, self._delta.tolist()))
+                 ) -> int:
+
+            return _delta[state_idx][symbol_idx]
+
+        step.__doc__ = Automaton.step.__doc__
+
+        return step
+
+    def _specialize_step(self) -> None:
+        """
+        Gives small alphabet automata a step() specialized to the current
+        dense transition table, and drops any stale one otherwise.
+        """
+
+        if self.alphabet_size <= MAX_SPECIALIZED_STEP_ALPHABET_SIZE:
+            self.step = self._make_specialized_step()
+        else:
+            self.__dict__.pop('step', None)
+
+    def walk(self, symbols: Symbols) -> Node:
+        """
+        Runs the given sequence of symbols through the automaton's transition
+        function, starting from the start state.
+
+        The walk itself runs over the dense transition table (jit-compiled if
+        numba is installed), so this is much faster than repeatedly calling
+        _get_next_state for long sequences.
+
+        :param      symbols:     The sequence of symbols to run
+
+        :returns:   The label of the state the automaton ends in
+
+        :raises     ValueError:  a symbol is not in the automaton's alphabet
+        :raises     ValueError:  a symbol has no transition defined along the
+                                 run
+        """
+
+        # falls back to a plain python loop if numba isn't installed
+        from ._fast import walk as fast_walk
+
+        try:
+            sym2idx = self._sym2idx
+            symbol_idxs = np.fromiter((sym2idx[symbol] for symbol in symbols),
+                                      dtype=np.int64)
+        except KeyError as e:
+            msg = f'given symbol ({e.args[0]}) is not in the automaton\'s ' + \
+                  f'symbol display map'
+            raise ValueError(msg)
+
+        start_state_idx = self._node_index_map[self.start_state]
+        end_state_idx = fast_walk(self._delta, start_state_idx, symbol_idxs)
+
+        if end_state_idx < 0:
+            msg = f'given symbols ({symbols}) have no defined run from ' + \
+                  f'the start state ({self.start_state})'
+            raise ValueError(msg)
+
+        return self._node_index_map.inv[int(end_state_idx)]
+
+    def is_accepting_batch(self, state_idxs: np.ndarray) -> np.ndarray:
+        """
+        Checks whether each of the given states is accepting, all at once.
+
+        :param      state_idxs:  The indices of the states to check, in
+                                 self._node_index_map
+
+        :returns:   bool array, True where the state at that index accepts
+        """
+
+        return self._accept[state_idxs].view(bool)
+
     @staticmethod
     def _convert_states_edges(nodes: dict, edges: dict,
                               final_transition_sym,
@@ -1061,11 +1496,41 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         if merge_sinks:
             self._nx_merge_sinks()
 
+        # the state indices must exist before building the dense transition
+        # table during the per-node computations
+        self._node_index_map = bidict({state: index
+                                       for index, state
+                                       in enumerate(self.nodes)})
+        num_nodes = len(self._node_index_map)
+        num_symbols = len(self._symbol_display_map)
+        self._delta = np.full((num_nodes, num_symbols), -1, dtype=np.int32)
+        self._pmf = np.zeros((num_nodes, num_symbols))
+        self._dists = [None] * num_nodes
+
         # do batch computations at initialization, as these shouldn't
         # frequently change
         for node in self.nodes:
             self._compute_node_data_properties(node, **node_data_args)
 
+        # each state's transition pmf was scattered into its row of the
+        # table. Accumulate at full precision, then quantize, which only
+        # copies the cdf if a reduced precision dtype was asked for.
+        self._cdf = np.cumsum(self._pmf, axis=1).astype(self._prob_dtype,
+                                                        copy=False)
+
+        # round-off can leave a row's cdf[-1] slightly below 1, so batch
+        # samples need to be clipped. Clipping to the last symbol with
+        # nonzero probability at each state means a zero probability symbol
+        # (which may have no transition at all) is never drawn.
+        self._max_symbol_idxs = (num_symbols - 1 -
+                                 np.argmax(self._pmf[:, ::-1] > 0.0, axis=1))
+
+        # the index map iterates in state index order. Automata that don't
+        # define acceptance store None, which is treated as non-accepting.
+        self._accept = np.array([bool(self.nodes[state].get('is_accepting'))
+                                 for state in self._node_index_map],
+                                dtype=np.uint8)
+
         self._set_node_labels(initial_weight_key, final_weight_key,
                               state_observation_key,
                               can_have_accepting_nodes)
@@ -1083,6 +1548,10 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         self.alphabet_size = len(self.symbols)
         self.num_states = len(self.state_labels)
 
+        # the transition table is now fixed, so small alphabet automata get a
+        # step() specialized to it. Re-initializing rebuilds / drops it.
+        self._specialize_step()
+
         # not all automaton have observations, and this needs to be computed
         # after self.state_labels exists
         if self.num_obs is not None:
@@ -1101,10 +1570,12 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
             self.num_obs = N_actual_obs
 
         # wait until all node computations are done to make the vectorized rep.
+        (self._indptr,
+         self._col,
+         self._esym,
+         self._eprob) = self._make_edge_arrays(self._node_index_map)
+
         if self.is_stochastic:
-            self._node_index_map = bidict({state: index
-                                           for index, state
-                                           in enumerate(self.nodes)})
             self._initial_state_distribution = self._make_initial_state_dist(
                 self._node_index_map)
             self._final_state_distribution = self._make_final_state_dist(
@@ -1190,32 +1661,30 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
 
         # creating the mapping from (start state, symbol) -> edge_dests
         disp_edge_symbols = self._convert_symbol_idxs(edge_symbols)
-        state_symbol_keys = list(zip([curr_state] * len(disp_edge_symbols),
-                                     disp_edge_symbols))
-        new_trans_map_entries = dict(zip(state_symbol_keys, edge_dests))
+        new_trans_map_entries = {(curr_state, symbol): dest_state
+                                 for symbol, dest_state
+                                 in zip(disp_edge_symbols, edge_dests)}
 
         # need to merge the newly computed transition map at node to the
         # existing map
         #
         # for a automaton, a given start state and symbol must have a
-        # deterministic transition
-        for key, dest_state in new_trans_map_entries.items():
-            start_state = key[0]
-            symbol = key[1]
-            if key in self._transition_map:
-                new_dest_state = dest_state != self._transition_map[key]
-                same_start_state = key in self._transition_map
-                non_deterministic_trans = same_start_state and new_dest_state
-                if non_deterministic_trans:
-                    msg = ('duplicate transition from state {} '
-                           'under symbol {} found - transition must be '
-                           'deterministic').format(start_state, symbol)
-                    raise warnings.warn(msg)
-
-                    self.is_deterministic = False
-
-        self._transition_map = {**self._transition_map,
-                                **new_trans_map_entries}
+        # deterministic transition. Re-initializing re-adds the same keys, so
+        # only a key that now maps to a different destination is an error.
+        existing_trans_map = self._transition_map
+        for key in existing_trans_map.keys() & new_trans_map_entries.keys():
+            if existing_trans_map[key] != new_trans_map_entries[key]:
+                start_state, symbol = key
+                msg = (f'duplicate transition from state {start_state} ' +
+                       f'under symbol {symbol} found - transition must be ' +
+                       'deterministic')
+                raise ValueError(msg)
+
+        existing_trans_map.update(new_trans_map_entries)
+
+        node_index_map = self._node_index_map
+        dest_idxs = [node_index_map[dest_state] for dest_state in edge_dests]
+        self._delta[node_index_map[curr_state], edge_symbols] = dest_idxs
 
     def _set_state_transition_dist(self, curr_state: Node,
                                    edge_key_map: dict,
@@ -1261,18 +1730,27 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         # need to convert the hashable symbols to their integer indices for
         # creating the categorical distribution, which only works with
         # integers
-        edge_data = self.edges([curr_state], data=True)
-        edge_dests = [edge[1] for edge in edge_data]
-
-        original_edge_symbols = [edge[2]['symbol'] for edge in edge_data]
-        edge_symbols = [self._symbol_display_map[symbol] for symbol in
-                        original_edge_symbols]
+        #
+        # walking the adjacency dict directly, in a single pass, avoids
+        # building (and re-iterating) a networkx edge view for every state
+        edge_dests = []
+        original_edge_symbols = []
+        edge_datas = []
+        for dest_state, keyed_edges in self._adj[curr_state].items():
+            for edge_datum in keyed_edges.values():
+                edge_dests.append(dest_state)
+                original_edge_symbols.append(edge_datum['symbol'])
+                edge_datas.append(edge_datum)
+
+        sym2idx = self._sym2idx
+        edge_symbols = [sym2idx[symbol] for symbol in original_edge_symbols]
         final_sym = self.final_transition_sym
-        final_trans_symbol_idx = self._symbol_display_map[final_sym]
+        final_trans_symbol_idx = sym2idx[final_sym]
 
         if stochastic:
             # need to add final state probability to trans dist
-            edge_probs = [edge[2]['probability'] for edge in edge_data]
+            edge_probs = [edge_datum['probability']
+                          for edge_datum in edge_datas]
             curr_final_state_prob = self._get_node_data(curr_state,
                                                         'final_probability')
 
@@ -1308,12 +1786,25 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
                                                         complete,
                                                         violating_state)
 
+        state_idx = self._node_index_map[curr_state]
+
         if self.is_sampleable:
+            # build the distribution's arrays once here, so the categorical
+            # can use them without making its own copies
+            symbol_idxs = np.array(edge_symbols, dtype=np.int64)
+            probs = np.array(edge_probs, dtype=np.float64)
+
             if self.is_normalized:
-                edge_probs = [p / sum(edge_probs) for p in edge_probs]
+                probs /= probs.sum()
+                edge_probs = probs.tolist()
 
-            next_sym_dist = rv_discrete(name='transition',
-                                        values=(edge_symbols, edge_probs))
+            next_sym_dist = _Categorical(symbol_idxs, probs,
+                                         cdf_dtype=self._prob_dtype)
+
+            # parallel edges can share a symbol, so their probabilities need
+            # to accumulate instead of overwriting each other
+            np.add.at(self._pmf[state_idx], next_sym_dist.xk,
+                      next_sym_dist.pk)
         else:
             next_sym_dist = None
 
@@ -1326,7 +1817,7 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         self._update_edges_from_lists(curr_state, edge_probs,
                                       new_disp_symbols,
                                       edge_dests, edge_key_map)
-        self._set_node_data(curr_state, 'trans_distribution', next_sym_dist)
+        self._dists[state_idx] = next_sym_dist
 
         return edge_probs, edge_dests, edge_symbols
 
@@ -1407,26 +1898,26 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
             else:
                 prob_to_add = 0.0
 
+        # if the state already has a transition under every symbol, there is
+        # nothing to complete and no probability mass to move around
+        present_symbols = frozenset(edge_symbols)
+        if len(present_symbols) == self._all_symbol_idxs.size:
+            return edge_probs, edge_dests, edge_symbols
+
         # here we add in the missing transition probabilities as just very
         # unlikely self-loops ('smooth') or 0 probability transitions to the
         # violating state ('violate')
-        num_of_missing_transitions = 0
-        new_edge_probs, new_edge_dests, new_edge_symbols = [], [], []
-        all_symbols_idxs = list(self._symbol_display_map.inv.keys())
-
-        # actually creating the completed transitions
-        for symbol in all_symbols_idxs:
-            if symbol not in edge_symbols:
-                num_of_missing_transitions += 1
-                new_edge_probs.append(prob_to_add)
-                new_edge_dests.append(dest_state)
-                new_edge_symbols.append(symbol)
+        new_edge_symbols = [symbol for symbol in self._sym2idx.values()
+                            if symbol not in present_symbols]
+        num_of_missing_transitions = len(new_edge_symbols)
+        new_edge_probs = [prob_to_add] * num_of_missing_transitions
+        new_edge_dests = [dest_state] * num_of_missing_transitions
 
         # re-arranging probability mass in the case of needing smoothing
         if complete == 'smooth':
-            all_possible_trans = [idx for idx, prob in enumerate(edge_probs) if
-                                  prob > 0.0]
-            num_orig_samples = len(all_possible_trans)
+            probs = np.asarray(edge_probs, dtype=np.float64)
+            all_possible_trans = probs > 0.0
+            num_orig_samples = np.count_nonzero(all_possible_trans)
 
             # now, we need to remove the smoothed probability mass from the
             # original transition distribution
@@ -1434,19 +1925,21 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
             added_prob_mass = self._smoothing_amount * num_added_symbols
             smoothing_per_orig_trans = added_prob_mass / num_orig_samples
 
-            for trans_idx in all_possible_trans:
-
-                if edge_probs[trans_idx] < smoothing_per_orig_trans:
-                    msg = f'smoothing failed: transition from state ' + \
-                          f'{curr_state} to state {edge_dests[trans_idx]} ' + \
-                          f'under symbol {edge_symbols[trans_idx]} has ' + \
-                          f'too little probability mass ' + \
-                          f'({edge_probs[trans_idx]}) to distribute the ' + \
-                          f'desired amount of per-symbol smoothing ' + \
-                          f'(self._smoothing_amount = {prob_to_add})'
-                    raise ValueError(msg)
+            too_little_mass = all_possible_trans & \
+                (probs < smoothing_per_orig_trans)
+            if too_little_mass.any():
+                trans_idx = np.flatnonzero(too_little_mass)[0]
+                msg = f'smoothing failed: transition from state ' + \
+                      f'{curr_state} to state {edge_dests[trans_idx]} ' + \
+                      f'under symbol {edge_symbols[trans_idx]} has ' + \
+                      f'too little probability mass ' + \
+                      f'({edge_probs[trans_idx]}) to distribute the ' + \
+                      f'desired amount of per-symbol smoothing ' + \
+                      f'(self._smoothing_amount = {prob_to_add})'
+                raise ValueError(msg)
 
-                edge_probs[trans_idx] -= smoothing_per_orig_trans
+            probs[all_possible_trans] -= smoothing_per_orig_trans
+            edge_probs = probs.tolist()
 
         # combining the new transitions with the smoothed, original
         # distribution to get the final smoothed distribution
@@ -1494,6 +1987,51 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
 
         return final_state_distribution
 
+    def _make_edge_arrays(self, node_index_map: bidict) -> (np.ndarray,
+                                                            np.ndarray,
+                                                            np.ndarray,
+                                                            np.ndarray):
+        """
+        Flattens the graph's edges into compressed sparse row (CSR) arrays.
+
+        :param      node_index_map:  The mapping from state label to index in
+                                     vectorized representation of the
+                                     automaton
+
+        :returns:   (num_states + 1) array of each state's offset into the edge
+                    arrays, each edge's destination state index, each edge's
+                    symbol index, each edge's probability (1.0 if it has
+                    none, nan if it is None)
+        """
+
+        num_states = len(node_index_map)
+        num_edges = self.number_of_edges()
+        symbol_map = self._symbol_display_map
+
+        indptr = np.zeros(num_states + 1, dtype=np.int32)
+        col = np.empty(num_edges, dtype=np.int32)
+        esym = np.empty(num_edges, dtype=np.int32)
+        eprob = np.empty(num_edges)
+
+        # the bidict iterates in index order, so each state's edges are
+        # contiguous and in the same order as the state indices
+        edge_idx = 0
+        for state, state_idx in node_index_map.items():
+            for dest_state, edges in self._adj[state].items():
+                dest_state_idx = node_index_map[dest_state]
+
+                for edge_data in edges.values():
+                    prob = edge_data.get('probability', 1.0)
+
+                    col[edge_idx] = dest_state_idx
+                    esym[edge_idx] = symbol_map[edge_data['symbol']]
+                    eprob[edge_idx] = np.nan if prob is None else prob
+                    edge_idx += 1
+
+            indptr[state_idx + 1] = edge_idx
+
+        return indptr, col, esym, eprob
+
     def _make_transition_matrices(self, node_index_map: bidict) -> dict:
         """
         Creates the mapping from a symbol to the state transition matrix under
@@ -1502,6 +2040,9 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         Not necessarily a proper stochastic matrix, especially in the case of
         stochastic matrices. Should be properly stochastic if is_sampleable.
 
+        Built directly from the flat edge arrays, which must have already been
+        made with the same node_index_map.
+
         :param      node_index_map:  The mapping from state label to index in
                                      vectorized representation of the
                                      distribution
@@ -1511,35 +2052,23 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
                     to state i to state j under the given symbol at entry [i,j]
         """
 
-        weight = 'probability'
         nonedge_trans_prob = 0.0
-        nodelist = list(node_index_map)
-        nodeset = set(node_index_map)
-
-        if len(nodelist) != len(nodeset):
-            msg = "Ambiguous ordering: `nodelist` contained duplicates."
-            raise nx.NetworkXError(msg)
-        transition_matrices = dict()
-
-        for symbol in self.symbols:
-            A = np.full((self.num_states, self.num_states), np.nan)
-            transition_matrices[symbol] = copy.deepcopy(A)
+        num_symbols = len(self._symbol_display_map)
+        edge_src_idxs = np.repeat(np.arange(len(node_index_map)),
+                                  np.diff(self._indptr))
 
-        for u, v, attrs in self.edges(data=True):
-            symbol = attrs['symbol']
-            curr_trans_mat = transition_matrices[symbol]
+        # only edges whose probability is explicitly None (nan in the edge
+        # arrays) don't contribute. Edges without one were stored as 1.0.
+        edge_weights = np.where(np.isnan(self._eprob), nonedge_trans_prob,
+                                self._eprob)
 
-            if (u in nodeset) and (v in nodeset):
-                i, j = node_index_map[u], node_index_map[v]
-                e_weight = attrs.get(weight, 1)
-                curr_trans_mat[i, j] = e_weight
+        trans_mats = np.full((num_symbols, self.num_states, self.num_states),
+                             nonedge_trans_prob)
+        trans_mats[self._esym, edge_src_idxs, self._col] = edge_weights
 
-            transition_matrices[symbol] = curr_trans_mat
-
-        for symbol in self.symbols:
-            A = transition_matrices[symbol]
-            A[np.isnan(A)] = nonedge_trans_prob
-            A = np.asarray(A)
+        symbol_map = self._symbol_display_map
+        transition_matrices = {symbol: trans_mats[symbol_map[symbol]]
+                               for symbol in self.symbols}
 
         return transition_matrices
 
@@ -1556,31 +2085,19 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         :raises     ValueError:       all given symbol indices must be ints
         """
 
-        display_symbols = []
+        symbol_idxs = np.asarray(integer_symbols)
 
-        # need to do type-checking / polymorphism handling here
-        if not isinstance(integer_symbols, collections.Iterable):
-            if isinstance(integer_symbols, int):
-                return self._symbol_display_map.inv[integer_symbols]
-            elif type(integer_symbols).__module__ == 'numpy':
-                if np.issubdtype(integer_symbols, np.integer):
-                    return self._symbol_display_map.inv[integer_symbols]
-            else:
-                msg = f'symbol index ({integer_symbols}) is not an int'
-                raise ValueError(msg)
-        else:
+        if symbol_idxs.size == 0:
+            return []
 
-            all_ints = all(np.issubdtype(type(sym), np.integer) for sym in
-                           integer_symbols)
-            if not all_ints:
-                msg = f'not all symbol indices ({integer_symbols}) are ints'
-                raise ValueError(msg)
+        if symbol_idxs.dtype.kind not in 'iu':
+            msg = f'not all symbol indices ({integer_symbols}) are ints'
+            raise ValueError(msg)
 
-        for integer_symbol in integer_symbols:
-            converted_symbol = self._symbol_display_map.inv[integer_symbol]
-            display_symbols.append(converted_symbol)
+        if symbol_idxs.ndim == 0:
+            return self._inv_symbol_array[int(symbol_idxs)]
 
-        return display_symbols
+        return self._inv_symbol_array[symbol_idxs].tolist()
 
     def _get_pydot_representation(self) -> Dot:
         """
@@ -1590,6 +2107,8 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         :rtype:     pydot.Dot
         """
 
+        from networkx.drawing.nx_pydot import to_pydot
+
         graph = to_pydot(self)
         graph.set_splines(True)
         graph.set_nodesep(0.5)
@@ -1634,8 +2153,8 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
         """
 
         if self.is_sampleable:
-            trans_distribution = self._get_node_data(curr_state,
-                                                     'trans_distribution')
+            state_idx = self._node_index_map[curr_state]
+            trans_distribution = self.transition_dist(state_idx)
             possible_symbols = self._convert_symbol_idxs(trans_distribution.xk)
             probabilities = trans_distribution.pk
         else:
@@ -1709,21 +2228,30 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
             graph = self
 
         label_dict = {}
+        node_datas = graph.nodes.data()
 
-        for node_name, node_data in graph.nodes.data():
+        # format all of the weights in bulk, instead of one node at a time
+        if initial_weight_key is not None:
+            initial_wt_strings = edge_weights_to_strings(
+                [node_data[initial_weight_key]
+                 for _, node_data in node_datas])
+
+        if final_weight_key is not None:
+            final_wt_strings = edge_weights_to_strings(
+                [node_data[final_weight_key] for _, node_data in node_datas])
+
+        for node_num, (node_name, node_data) in enumerate(node_datas):
 
             nodel_key = node_name
 
             if initial_weight_key is not None:
-                weight = node_data[initial_weight_key]
-                initial_wt_string = edge_weight_to_string(weight)
+                initial_wt_string = initial_wt_strings[node_num]
                 node_name = initial_wt_string + ' : ' + node_name
             else:
                 node_dot_label_string = node_name
 
             if final_weight_key is not None:
-                weight = node_data[final_weight_key]
-                final_wt_string = edge_weight_to_string(weight)
+                final_wt_string = final_wt_strings[node_num]
                 node_dot_label_string = node_name + ' : ' + final_wt_string
             else:
                 node_dot_label_string = node_name
@@ -1776,21 +2304,20 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
 
         # this needs to be a mapping from edges (node label tuples) to a
         # dictionary of attributes
-        label_dict = {}
+        edges = list(graph.edges(data=True, keys=True))
+        edge_label_strings = [str(data['symbol']) for _, _, _, data in edges]
 
-        for u, v, key, data in graph.edges(data=True, keys=True):
+        if edge_weight_key is not None:
+            wt_strs = edge_weights_to_strings([data[edge_weight_key]
+                                               for _, _, _, data in edges])
+            edge_label_strings = [symbol_str + ': ' + wt_str
+                                  for symbol_str, wt_str
+                                  in zip(edge_label_strings, wt_strs)]
 
-            if edge_weight_key is not None:
-                wt_str = edge_weight_to_string(data[edge_weight_key])
-                edge_label_string = str(data['symbol']) + ': ' + wt_str
-            else:
-                edge_label_string = str(data['symbol'])
-
-            new_label_property = {'label': edge_label_string,
-                                  'fontcolor': 'blue'}
-            node_identifier = (u, v, key)
-
-            label_dict[node_identifier] = new_label_property
+        label_dict = {(u, v, key): {'label': edge_label_string,
+                                    'fontcolor': 'blue'}
+                      for (u, v, key, _), edge_label_string
+                      in zip(edges, edge_label_strings)}
 
         nx.set_edge_attributes(graph, label_dict)
 
@@ -1813,11 +2340,6 @@ class Automaton(nx.MultiDiGraph, metaclass=ABCMeta):
 
         node_data = graph.nodes.data()
 
-        if not self.is_sampleable and data_key == 'trans_distribution':
-            msg = 'automaton is not sampleable and thus does not have ' + \
-                  'transition distributions'
-            raise TypeError(msg)
-
         return node_data[node_label][data_key]
 
     def _set_node_data(self, node_label: Node, data_key: str, data,
@@ -1966,10 +2488,13 @@ def node_obs_to_str(obs: Observation) -> str:
     return obs_str
 
 
+@lru_cache(maxsize=None, typed=True)
 def edge_weight_to_string(weight: {int, float}) -> str:
     """
     returns a numeric edge weight as an appropriately formatted string
 
+    memoized, as automata tend to re-use a small number of distinct weights
+
     :param      weight:  The edge weight to convert to string.
     :type       weight:  int or float
 
@@ -1983,3 +2508,27 @@ def edge_weight_to_string(weight: {int, float}) -> str:
                                               digits=2)
 
     return wt_str
+
+
+def edge_weights_to_strings(weights: List[{int, float}]) -> List[str]:
+    """
+    returns numeric edge weights as appropriately formatted strings
+
+    all-int and all-float weights are formatted in a single numpy call,
+    anything else is formatted by edge_weight_to_string one at a time.
+
+    :param      weights:  The edge weights to convert to strings.
+
+    :returns:   properly formatted weight strings
+    """
+
+    weight_types = set(map(type, weights))
+
+    if weight_types == {int}:
+        fmt = '%d'
+    elif weight_types == {float}:
+        fmt = '%.2f'
+    else:
+        return [edge_weight_to_string(weight) for weight in weights]
+
+    return np.char.mod(fmt, np.array(weights)).tolist()
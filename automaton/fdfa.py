@@ -1,5 +1,6 @@
 # 3rd-party packages
 import pygraphviz
+import numpy as np
 import re
 import networkx as nx
 from networkx.drawing.nx_pydot import read_dot
@@ -30,7 +31,6 @@ class FDFA(Automaton):
         - out_frequency:   out "flow" of state frequency for each node
                            total times that state was visited with outgoing
                            transitions.
-        - trans_distribution: None, just there for consistency with PDFA
         - is_accepting: None, just there for consistency with PDFA
 
     Edge Properties
@@ -64,6 +64,8 @@ class FDFA(Automaton):
     :param      empty_transition_sym:  representation of the empty symbol
                                        (a.k.a. lambda). If not given, will
                                        default to base class default.
+    :param      prob_dtype:            The floating point dtype used to
+                                       store the sampling cdfs
     """
 
     def __init__(self, nodes: NXNodeList,
@@ -73,7 +75,8 @@ class FDFA(Automaton):
                  num_states: int,
                  start_state: Node,
                  final_transition_sym: {Symbol, None}=None,
-                 empty_transition_sym: {Symbol, None}=None) -> 'FDFA':
+                 empty_transition_sym: {Symbol, None}=None,
+                 prob_dtype: type = np.float32) -> 'FDFA':
 
         # need to start with a fully initialized automaton
         super().__init__(nodes, edges, symbol_display_map,
@@ -86,7 +89,8 @@ class FDFA(Automaton):
                          initial_weight_key='initial_frequency',
                          final_weight_key='final_frequency',
                          can_have_accepting_nodes=False,
-                         edge_weight_key='frequency')
+                         edge_weight_key='frequency',
+                         prob_dtype=prob_dtype)
 
     def to_pdfa_data(self) -> Tuple[NXNodeList, NXEdgeList]:
         """
@@ -116,7 +120,6 @@ class FDFA(Automaton):
             new_final_probability = final_freq / number_of_choices
 
             new_node_data = {'final_probability': new_final_probability,
-                             'trans_distribution': None,
                              'is_accepting': None}
             pdfa_nodes.append((curr_node, new_node_data))
 
@@ -244,7 +247,6 @@ class FDFA(Automaton):
             new_node_label = 'q' + str(node_ID)
             new_node_data = {'final_frequency': 0,
                              'initial_frequency': initial_frequency,
-                             'trans_distribution': None,
                              'isAccepting': None}
 
             nodes[new_node_label] = new_node_data
@@ -392,8 +394,8 @@ class FDFA(Automaton):
         edge_dests = [edge[1] for edge in edge_data]
 
         original_edge_symbols = [edge[2]['symbol'] for edge in edge_data]
-        edge_symbols = [self._symbol_display_map[symbol] for symbol in
-                        original_edge_symbols]
+        sym2idx = self._sym2idx
+        edge_symbols = [sym2idx[symbol] for symbol in original_edge_symbols]
         self._set_trans_map(curr_node, edge_symbols, edge_dests)
 
     def _compute_node_flow(self, curr_node: Node,
@@ -3,6 +3,7 @@ import queue
 import copy
 import warnings
 import bidict
+from operator import itemgetter
 from tqdm.auto import tqdm
 from typing import List, Tuple, Callable, Set, Iterable
 import numpy as np
@@ -106,11 +107,9 @@ def postprocess_MPS(mps_symbols: Iterable[int],
 
     # need to apply the same sort of post-processing to each string in the heap
     if mps_symbols:
-        new_viable_strings = MaxHeap()
-
-        for prob, string in viable_strings:
-            string = process_string(string)
-            new_viable_strings.heappush((prob, string))
+        new_viable_strings = MaxHeap(key=itemgetter(0))
+        new_viable_strings.heapify((prob, process_string(string))
+                                   for prob, string in viable_strings)
 
         viable_strings = new_viable_strings
 
@@ -291,12 +290,12 @@ def BMPS_exact(symbols: List[int], M: np.ndarray, S: np.ndarray, F: np.ndarray,
     if depth_first:
         search_heap = MinHeap()
     else:
-        search_heap = MaxHeap()
+        search_heap = MaxHeap(key=itemgetter(0))
 
     # viable_strings are in a max heap keyed on viable string probability,
     # as we want to return the "best" strings ranked in descending string
     # probability
-    viable_strings = MaxHeap()
+    viable_strings = MaxHeap(key=itemgetter(0))
     seen = set()
     viable_str_probs = set()
 
@@ -439,7 +438,7 @@ def SWDFA_MPS(states: Set[Node],
 
     # terminate all of the strings, and then find the best one using a max heap
     # sort, as we also want to return this heap
-    viable_strings = MaxHeap()
+    terminated_strings = []
 
     for idx, term_prob in enumerate(F.flatten()):
         state = node_index_map.inv[idx]
@@ -448,7 +447,10 @@ def SWDFA_MPS(states: Set[Node],
 
         if string_prob > 0:
             string = best_symbols[state]
-            viable_strings.heappush((string_prob, string))
+            terminated_strings.append((string_prob, string))
+
+    viable_strings = MaxHeap(key=itemgetter(0))
+    viable_strings.heapify(terminated_strings)
 
     # need to check if we found any non-zero prob. strings
     if viable_strings:
@@ -63,11 +63,13 @@ class PDFA(Automaton):
     Node Attributes
     -----------------
         - final_probability: final state probability for the node
-        - trans_distribution: a sampled-able function to select the next state
-          and emitted symbol
         - is_accepting: a boolean flag determining whether the pdfa considers
           the node accepting
 
+    Each state's sampleable transition distribution (a function to select
+    the next state and emitted symbol) is kept outside of the node data, see
+    Automaton.transition_dist().
+
     Edge Properties
     -----------------
         - symbol: the symbol value emitted when the edge is traversed
@@ -108,6 +110,8 @@ class PDFA(Automaton):
     :param      merge_sinks:           whether to combine all states
                                        together that have no outgoing
                                        edges
+    :param      prob_dtype:            The floating point dtype used to
+                                       store the sampling cdfs
     """
 
     def __init__(self,
@@ -122,7 +126,8 @@ class PDFA(Automaton):
                  final_transition_sym: {Symbol, None}=None,
                  empty_transition_sym: {Symbol, None}=None,
                  beta: float = 0.95,
-                 merge_sinks: bool = False) -> 'PDFA':
+                 merge_sinks: bool = False,
+                 prob_dtype: type = np.float32) -> 'PDFA':
 
         self._beta = beta
         """the final state probability needed for a state to accept"""
@@ -140,7 +145,8 @@ class PDFA(Automaton):
                          can_have_accepting_nodes=True,
                          edge_weight_key='probability',
                          smoothing_amount=smoothing_amount,
-                         merge_sinks=merge_sinks)
+                         merge_sinks=merge_sinks,
+                         prob_dtype=prob_dtype)
 
     def predict(self, symbols: Symbols,
                 pred_method: str = 'max_prob') -> Symbol:
@@ -494,7 +500,8 @@ class PDFABuilder(Builder):
     def _from_fdfa(self, fdfa: FDFA,
                    merge_sinks: bool = False,
                    smooth_transitions: bool = False,
-                   smoothing_amount: float = SMOOTHING_AMOUNT) -> PDFA:
+                   smoothing_amount: float = SMOOTHING_AMOUNT,
+                   prob_dtype: type = np.float32) -> PDFA:
         """
         Returns an instance of a PDFA from an instance of FDFA
 
@@ -507,6 +514,8 @@ class PDFABuilder(Builder):
                                          sym. transition distributions
         :param      smoothing_amount:    probability mass to re-assign to
                                          unseen symbols at each node
+        :param      prob_dtype:          The floating point dtype used to
+                                         store the sampling cdfs
 
         :returns:   instance of an initialized PDFA object
         """
@@ -532,6 +541,7 @@ class PDFABuilder(Builder):
             start_state=fdfa.start_state,
             smooth_transitions=smooth_transitions,
             smoothing_amount=smoothing_amount,
-            merge_sinks=merge_sinks)
+            merge_sinks=merge_sinks,
+            prob_dtype=prob_dtype)
 
         return instance
@@ -3,9 +3,12 @@ import re
 import queue
 import warnings
 import math
+import itertools
+import numpy as np
 from typing import Tuple
 from bidict import bidict
 from collections.abc import Iterable
+from operator import itemgetter
 from scipy.stats import rv_discrete
 
 # local packages
@@ -78,6 +81,9 @@ class Product(Automaton):
                                                     except if we would like to
                                                     be able to easily sample
                                                     traces
+        :param      prob_dtype:                     The floating point dtype
+                                                    used to store the sampling
+                                                    cdfs
     """
 
     def __init__(self,
@@ -90,7 +96,8 @@ class Product(Automaton):
                  num_obs: int,
                  final_transition_sym: Symbol,
                  empty_transition_sym: Symbol,
-                 is_normalized: bool) -> 'Product':
+                 is_normalized: bool,
+                 prob_dtype: type = np.float32) -> 'Product':
         """
         Constructs a new instance of an Product automaton object.
         """
@@ -114,7 +121,8 @@ class Product(Automaton):
                          final_weight_key='final_probability',
                          state_observation_key='observation',
                          can_have_accepting_nodes=True,
-                         edge_weight_key='probability')
+                         edge_weight_key='probability',
+                         prob_dtype=prob_dtype)
 
     def compute_strategy(
         self,
@@ -270,9 +278,8 @@ class Product(Automaton):
             controls, _, sequence_probs = results
             if controls is not None:
                 # convert to max heap to match MPS sampling returns
-                viable_traces = MaxHeap()
-                for prob, control in zip(sequence_probs, controls):
-                    viable_traces.heappush((prob, control))
+                viable_traces = MaxHeap(key=itemgetter(0))
+                viable_traces.heapify(zip(sequence_probs, controls))
             else:
                 viable_traces = None
 
@@ -322,11 +329,9 @@ class Product(Automaton):
                     add_entropy=True)
 
                 # merge the two heaps
-                viable_traces = MaxHeap()
-                for item_1 in viable_traces_min:
-                    viable_traces.heappush(item_1)
-                for item_2 in viable_traces_max:
-                    viable_traces.heappush(item_2)
+                viable_traces = MaxHeap(key=itemgetter(0))
+                viable_traces.heapify(itertools.chain(viable_traces_min,
+                                                      viable_traces_max))
 
         # need to post-process the sampled data, as this is a product
         if viable_traces is not None:
@@ -347,9 +352,8 @@ class Product(Automaton):
                 new_traces = [symbols[idx] for idx in sampled_trace_idxs]
                 new_probs = [probs[idx] for idx in sampled_trace_idxs]
 
-                viable_traces = MaxHeap()
-                for prob, trace in zip(new_probs, new_traces):
-                    viable_traces.heappush((prob, trace))
+                viable_traces = MaxHeap(key=itemgetter(0))
+                viable_traces.heapify(zip(new_probs, new_traces))
 
             samples, trace_lengths, trace_probs = [], [], []
 
@@ -424,7 +428,6 @@ class Product(Automaton):
         # specification's underlying graph
         violating_state = SPEC_VIOLATING_STATE
         violating_state_props = {'final_probability': 0.00,
-                                 'trans_distribution': None,
                                  'is_accepting': None,
                                  'is_violating': True}
         specification.add_node(violating_state, **violating_state_props)
@@ -621,7 +624,6 @@ class Product(Automaton):
 
         if prod_state not in nodes:
             prod_state_data = {'final_probability': q_final_prob,
-                               'trans_distribution': None,
                                'is_violating': is_violating,
                                'is_accepting': None,
                                'observation': observation}
@@ -815,7 +817,8 @@ class ProductBuilder(Builder):
     def _from_automata(self, dynamical_system: TransitionSystem,
                        specification: PDFA,
                        normalize_trans_probabilities: bool = False,
-                       show_steps: bool = False) -> Product:
+                       show_steps: bool = False,
+                       prob_dtype: type = np.float32) -> Product:
         """
         Returns an instance of a Product Automaton from existing automata
 
@@ -836,6 +839,9 @@ class ProductBuilder(Builder):
                                                     from the automaton.
         :param      show_steps:                     draw intermediate steps in
                                                     the product creation
+        :param      prob_dtype:                     The floating point dtype
+                                                    used to store the sampling
+                                                    cdfs
 
         :returns:   instance of an initialized Product automaton object
         """
@@ -854,6 +860,7 @@ class ProductBuilder(Builder):
 
         config_data['is_normalized'] = \
             normalize_trans_probabilities
+        config_data['prob_dtype'] = prob_dtype
 
         # saving these so we can just return initialized instances if the
         # underlying data has not changed
@@ -1,5 +1,6 @@
 import os
-import collections
+import numpy as np
+import collections.abc
 from typing import Tuple, Iterable
 from bidict import bidict
 
@@ -49,6 +50,8 @@ class TransitionSystem(Automaton):
     :param      empty_transition_sym:  representation of the empty symbol
                                        (a.k.a. lambda). If not given, will
                                        default to base class default.
+    :param      prob_dtype:            The floating point dtype used to
+                                       store the sampling cdfs
     """
 
     def __init__(
@@ -61,7 +64,8 @@ class TransitionSystem(Automaton):
         start_state: Node,
         num_obs: int,
         final_transition_sym: {Symbol, None}=DEFAULT_FINAL_TRANS_SYMBOL,
-        empty_transition_sym: {Symbol, None}=DEFAULT_EMPTY_TRANS_SYMBOL
+        empty_transition_sym: {Symbol, None}=DEFAULT_EMPTY_TRANS_SYMBOL,
+        prob_dtype: type = np.float32
     ) -> 'TransitionSystem':
 
         # need to start with a fully initialized automaton
@@ -75,7 +79,8 @@ class TransitionSystem(Automaton):
                          empty_transition_sym=empty_transition_sym,
                          state_observation_key='observation',
                          can_have_accepting_nodes=True,
-                         edge_weight_key=None)
+                         edge_weight_key=None,
+                         prob_dtype=prob_dtype)
 
     def transition(self, curr_state: Node,
                    input_symbol: Symbol,
@@ -125,7 +130,9 @@ class TransitionSystem(Automaton):
         """
 
         # need to do type-checking / polymorphism handling here
-        if isinstance(word, str) or not isinstance(word, collections.Iterable):
+        is_single_symbol = (isinstance(word, str) or
+                            not isinstance(word, collections.abc.Iterable))
+        if is_single_symbol:
             word = [word]
 
         curr_state = self.start_state
@@ -294,7 +301,9 @@ class MinigridTransitionSystem(TransitionSystem):
             self.env.render_notebook()
 
         # need to do type-checking / polymorphism handling here
-        if isinstance(word, str) or not isinstance(word, collections.Iterable):
+        is_single_symbol = (isinstance(word, str) or
+                            not isinstance(word, collections.abc.Iterable))
+        if is_single_symbol:
             word = [word]
 
         output_word, state_sequence = super().run(word, show_steps=show_steps)
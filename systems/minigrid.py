@@ -802,8 +802,7 @@ class StaticMinigridTSWrapper(gym.core.Wrapper):
             is_goal = False
 
         if state not in nodes:
-            state_data = {'trans_distribution': None,
-                          'observation': obs_str,
+            state_data = {'observation': obs_str,
                           'is_accepting': is_goal,
                           'color': color}
             nodes[state] = state_data
@@ -0,0 +1,283 @@
+import copy
+import os
+import pickle
+
+import numpy as np
+import pytest
+import yaml
+
+from wombats.automaton import (PDFA, Automaton, TSBuilder, PDFABuilder,
+                               ProductBuilder)
+from wombats.automaton.base import _Categorical
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'config')
+
+
+def load_pdfa(config_name: str, **kwargs) -> PDFA:
+    """
+    Builds a PDFA from one of the config files, overriding any of its
+    constructor arguments with kwargs
+    """
+
+    config_file = os.path.join(CONFIG_DIR, config_name + '.yaml')
+    with open(config_file, 'r') as stream:
+        config_data = yaml.safe_load(stream)
+
+    (symbol_display_map,
+     states,
+     edges) = Automaton._convert_states_edges(
+        config_data['nodes'],
+        config_data['edges'],
+        config_data['final_transition_sym'],
+        config_data['empty_transition_sym'],
+        is_stochastic=True)
+    config_data['symbol_display_map'] = symbol_display_map
+    config_data['nodes'] = states
+    config_data['edges'] = edges
+    config_data.update(kwargs)
+
+    return PDFA(**config_data)
+
+
+@pytest.mark.parametrize('prob_dtype', [np.float16, np.float32, np.float64])
+def test_pdfa_prob_dtype(prob_dtype):
+
+    pdfa = load_pdfa('PDFA_simple_running_example', prob_dtype=prob_dtype)
+
+    assert pdfa._cdf.dtype == prob_dtype
+    assert all(dist.cdf.dtype == prob_dtype for dist in pdfa._dists
+               if dist is not None)
+
+
+@pytest.mark.parametrize('prob_dtype', [np.float16, np.float32, np.float64])
+def test_reduced_precision_sampling(prob_dtype):
+
+    pdfa = load_pdfa('PDFA_simple_running_example', prob_dtype=prob_dtype)
+    random_state = np.random.RandomState(0)
+
+    for dist in pdfa._dists:
+        samples = dist.rvs(size=10000, random_state=random_state)
+
+        assert np.isin(samples, dist.xk[dist.pk > 0]).all()
+        sample_freqs = (samples[:, np.newaxis] == dist.xk).mean(axis=0)
+        np.testing.assert_allclose(sample_freqs, dist.pk, atol=0.02)
+
+
+def test_pdfa_prob_dtype_must_be_floating():
+
+    with pytest.raises(ValueError):
+        load_pdfa('PDFA_simple_running_example', prob_dtype=np.int32)
+
+
+def test_step():
+
+    pdfa = load_pdfa('PDFA_simple_running_example')
+
+    # small alphabet automata get a specialized step(), which must agree
+    # with the generic one
+    assert 'step' in pdfa.__dict__
+
+    num_states, num_symbols = pdfa._delta.shape
+    for state_idx in range(num_states):
+        for symbol_idx in range(num_symbols):
+            next_state_idx = pdfa.step(state_idx, symbol_idx)
+
+            assert type(next_state_idx) is int
+            assert next_state_idx == Automaton.step(pdfa, state_idx,
+                                                    symbol_idx)
+            assert next_state_idx == pdfa._delta[state_idx, symbol_idx]
+            assert type(Automaton.step(pdfa, state_idx, symbol_idx)) is int
+
+
+def pickle_round_trip(obj):
+
+    return pickle.loads(pickle.dumps(obj))
+
+
+@pytest.mark.parametrize('copier', [pickle_round_trip, copy.deepcopy])
+def test_pdfa_pickle_round_trip(copier):
+
+    pdfa = load_pdfa('PDFA_simple_running_example')
+    loaded_pdfa = copier(pdfa)
+
+    assert 'step' in loaded_pdfa.__dict__
+
+    num_states, num_symbols = pdfa._delta.shape
+    for state_idx in range(num_states):
+        for symbol_idx in range(num_symbols):
+            assert (loaded_pdfa.step(state_idx, symbol_idx) ==
+                    pdfa.step(state_idx, symbol_idx))
+
+    np.testing.assert_array_equal(loaded_pdfa._cdf, pdfa._cdf)
+
+
+def test_edge_arrays_match_graph():
+
+    pdfa = load_pdfa('PDFA_simple_running_example')
+    state_map = pdfa._node_index_map
+    symbol_map = pdfa._symbol_display_map
+
+    assert pdfa._indptr[0] == 0
+    assert pdfa._indptr[-1] == pdfa.number_of_edges()
+
+    for state, state_idx in state_map.items():
+        start, stop = pdfa._indptr[state_idx], pdfa._indptr[state_idx + 1]
+        csr_edges = sorted(zip(pdfa._col[start:stop].tolist(),
+                               pdfa._esym[start:stop].tolist(),
+                               pdfa._eprob[start:stop].tolist()))
+
+        graph_edges = sorted((state_map[dest_state],
+                              symbol_map[edge_data['symbol']],
+                              edge_data['probability'])
+                             for _, dest_state, edge_data
+                             in pdfa.edges(state, data=True))
+
+        assert csr_edges == pytest.approx(graph_edges)
+
+
+def test_walk():
+
+    pdfa = load_pdfa('PDFA_simple_running_example')
+
+    assert pdfa.walk([]) == 'q2'
+    assert pdfa.walk(['empty_red_open', 'floor_purple_open',
+                      'empty_red_open', 'floor_green_open']) == 'q0'
+
+
+@pytest.mark.parametrize('symbols', [['floor_green_open', 'floor_green_open'],
+                                     ['not_a_symbol']])
+def test_walk_without_a_run(symbols):
+
+    pdfa = load_pdfa('PDFA_simple_running_example')
+
+    with pytest.raises(ValueError):
+        pdfa.walk(symbols)
+
+
+def check_batch_traces(pdfa, traces, trace_lengths, trace_probs, N):
+    """
+    Checks each batch sampled trace is a run of the pdfa with the
+    probability of the run
+    """
+
+    sym2idx = pdfa._symbol_display_map
+    final_sym_idx = sym2idx[pdfa.final_transition_sym]
+    start_state_idx = pdfa._node_index_map[pdfa.start_state]
+
+    for trace, trace_length, trace_prob in zip(traces, trace_lengths,
+                                               trace_probs):
+        assert len(trace) == trace_length
+
+        state_idx = start_state_idx
+        run_prob = 1.0
+        for symbol in trace:
+            symbol_idx = sym2idx[symbol]
+            run_prob *= pdfa._pmf[state_idx, symbol_idx]
+            state_idx = pdfa._delta[state_idx, symbol_idx]
+            assert state_idx >= 0
+
+        if trace_length < N:
+            run_prob *= pdfa._pmf[state_idx, final_sym_idx]
+            assert run_prob > 0.0
+            assert trace_prob == pytest.approx(run_prob)
+        else:
+            assert trace_prob == 0.0
+
+
+def test_generate_batch():
+
+    N = 20
+    pdfa = load_pdfa('PDFA_simple_running_example')
+    batch = pdfa.generate_batch(1000, N, random_state=0)
+
+    check_batch_traces(pdfa, *batch, N)
+
+
+def test_generate_batch_clips_to_possible_symbols():
+
+    N = 20
+    pdfa = load_pdfa('PDFA_simple_running_example')
+
+    # exaggerate the round-off that can leave a row's cdf[-1] below 1, so
+    # plenty of draws land past the end of every row. The trailing symbol
+    # column has no transitions at all, so the draws past the end must be
+    # clipped to each state's last possible symbol.
+    assert (pdfa._delta[:, -1] < 0).all()
+    pdfa._cdf *= 0.9
+    batch = pdfa.generate_batch(1000, N, random_state=0)
+
+    check_batch_traces(pdfa, *batch, N)
+
+
+def test_categorical_keeps_sorted_arrays():
+
+    edge_symbols = np.array([0, 2, 3], dtype=np.int64)
+    edge_probs = np.array([0.5, 0.3, 0.2])
+    dist = _Categorical(edge_symbols, edge_probs)
+
+    assert dist.xk is edge_symbols
+    assert dist.pk is edge_probs
+
+
+def test_categorical_sorts_by_symbol():
+
+    dist = _Categorical([3, 0, 2], [0.2, 0.5, 0.3])
+
+    np.testing.assert_array_equal(dist.xk, [0, 2, 3])
+    np.testing.assert_allclose(dist.pk, [0.5, 0.3, 0.2])
+    np.testing.assert_allclose(dist.cdf, [0.5, 0.8, 1.0])
+
+
+@pytest.mark.parametrize('cdf_dtype', [np.float16, np.float32, np.float64])
+def test_categorical_never_samples_zero_probability(cdf_dtype):
+
+    # the cdf is shrunk so that plenty of draws land past its end. Those
+    # must be clipped to the last nonzero probability symbol instead of the
+    # last symbol.
+    dist = _Categorical([0, 1, 2], [0.6, 0.4, 0.0], cdf_dtype=cdf_dtype)
+    dist.cdf = (dist.cdf * 0.9).astype(cdf_dtype)
+    samples = dist.rvs(size=10000, random_state=np.random.RandomState(0))
+
+    assert set(samples.tolist()) == {0, 1}
+
+
+def test_is_accepting_batch():
+
+    pdfa = load_pdfa('PDFA_basic_synthesis_experiments')
+    state_idxs = np.array([3, 0, 3, 1, 2])
+    is_accepting = pdfa.is_accepting_batch(state_idxs)
+
+    states = [pdfa._node_index_map.inv[state_idx] for state_idx in state_idxs]
+    expected = [bool(pdfa.nodes[state]['is_accepting']) for state in states]
+
+    assert is_accepting.dtype == bool
+    assert is_accepting.tolist() == expected
+    assert any(expected) and not all(expected)
+
+
+def test_transition_dist():
+
+    pdfa = load_pdfa('PDFA_simple_running_example')
+    symbol_map = pdfa._symbol_display_map
+
+    for state, state_idx in pdfa._node_index_map.items():
+        dist = pdfa.transition_dist(state_idx)
+        dist_probs = dict(zip(dist.xk.tolist(), dist.pk.tolist()))
+
+        assert sum(dist_probs.values()) == pytest.approx(1.0)
+        for _, _, edge_data in pdfa.edges(state, data=True):
+            symbol_idx = symbol_map[edge_data['symbol']]
+            assert (dist_probs[symbol_idx] ==
+                    pytest.approx(edge_data['probability']))
+
+
+def test_transition_dist_not_sampleable():
+
+    config_name = os.path.join(CONFIG_DIR, '{}_basic_synthesis_experiments')
+    dynamical_system = TSBuilder()(config_name.format('TS') + '.yaml')
+    specification = PDFABuilder()(config_name.format('PDFA') + '.yaml')
+    product = ProductBuilder()((dynamical_system, specification))
+
+    assert not product.is_sampleable
+    with pytest.raises(TypeError):
+        product.transition_dist(0)
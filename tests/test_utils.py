@@ -0,0 +1,217 @@
+import random
+
+import pytest
+
+from wombats.utils import (MinHeap, MaxHeap, BoundedMinHeap, MinHeap4,
+                           MaxHeap4, NumericMinHeap)
+from wombats.utils_nb import NumbaMinHeap
+
+
+def random_items(n: int = 1000, seed: int = 0) -> list:
+    """
+    Makes a list of random integers, with plenty of repeats
+    """
+
+    rng = random.Random(seed)
+
+    return [rng.randint(0, n // 4) for _ in range(n)]
+
+
+def drain(heap) -> list:
+    """
+    Pops all of the items off of the heap, in order
+    """
+
+    return [heap.heappop() for _ in range(len(heap))]
+
+
+@pytest.mark.parametrize('heap_type, reverse', [(MinHeap4, False),
+                                                (MaxHeap4, True)])
+def test_4ary_heap_order(heap_type, reverse):
+
+    items = random_items()
+    heap = heap_type()
+    for x in items:
+        heap.heappush(x)
+
+    assert len(heap) == len(items)
+    assert heap[0] == (max(items) if reverse else min(items))
+    assert drain(heap) == sorted(items, reverse=reverse)
+    assert len(heap) == 0
+
+
+def test_4ary_heap_interleaved_push_pop():
+
+    items = random_items()
+    heap = MinHeap4()
+    reference = []
+    for i, x in enumerate(items):
+        heap.heappush(x)
+        reference.append(x)
+
+        if i % 3 == 0:
+            reference.sort()
+            assert heap.heappop() == reference.pop(0)
+
+    assert drain(heap) == sorted(reference)
+
+
+def test_4ary_max_heap_key_breaks_ties_in_insertion_order():
+
+    items = [(priority, i) for i, priority in enumerate(random_items())]
+    heap = MaxHeap4(key=lambda item: item[0])
+    for item in items:
+        heap.heappush(item)
+
+    # sorting is stable, so equal priorities stay in insertion order
+    assert drain(heap) == sorted(items, key=lambda item: -item[0])
+
+
+def test_numeric_min_heap():
+
+    items = [float(x) for x in random_items()]
+    heap = NumericMinHeap()
+    for x in items:
+        heap.heappush(x)
+
+    assert len(heap) == len(items)
+    assert heap[0] == min(items)
+    assert drain(heap) == sorted(items)
+
+
+def test_numeric_min_heap_heapify():
+
+    items = [float(x) for x in random_items()]
+    heap = NumericMinHeap()
+    heap.heapify(items)
+
+    assert heap.raw().typecode == 'd'
+    assert drain(heap) == sorted(items)
+
+    heap.heapify([])
+    assert len(heap) == 0
+
+
+@pytest.mark.parametrize('heap_args, heap_kwargs', [((), {}), ((128,), {}),
+                                                    ((), {'capacity': 1})])
+def test_numba_min_heap(heap_args, heap_kwargs):
+
+    items = [float(x) for x in random_items()]
+    heap = NumbaMinHeap(*heap_args, **heap_kwargs)
+    for x in items:
+        heap.heappush(x)
+
+    assert len(heap) == len(items)
+    assert heap[0] == min(items)
+    assert drain(heap) == sorted(items)
+
+    with pytest.raises(IndexError):
+        heap.heappop()
+
+
+@pytest.mark.parametrize('key', [None, lambda x: x % 7])
+def test_nsmallest_nlargest(key):
+
+    items = random_items()
+    sort_key = (lambda x: x) if key is None else key
+
+    assert (MinHeap.nsmallest(10, items, key=key) ==
+            sorted(items, key=sort_key)[:10])
+    assert (MinHeap.nlargest(10, items, key=key) ==
+            sorted(items, key=sort_key, reverse=True)[:10])
+    assert MaxHeap.nsmallest(0, items) == []
+    assert MaxHeap.nlargest(len(items) + 1, items) == sorted(items)[::-1]
+
+
+@pytest.mark.parametrize('heap_type, heap_kwargs, reverse',
+                         [(MinHeap, {}, False),
+                          (MaxHeap, {}, True),
+                          (MaxHeap, {'key': lambda x: x}, True)])
+def test_heappushpop_heapreplace(heap_type, heap_kwargs, reverse):
+
+    items = random_items()
+    heap = heap_type(**heap_kwargs)
+    heap.heapify(items[:100])
+    reference = sorted(items[:100], reverse=reverse)
+
+    for i, x in enumerate(items[100:]):
+        if i % 2:
+            # pushes x, then pops the top of the heap, which might be x
+            reference = sorted(reference + [x], reverse=reverse)
+            assert heap.heappushpop(x) == reference.pop(0)
+        else:
+            # pops the top of the heap and only then pushes x
+            assert heap.heapreplace(x) == reference.pop(0)
+            reference = sorted(reference + [x], reverse=reverse)
+
+    assert drain(heap) == reference
+
+    with pytest.raises(IndexError):
+        heap_type(**heap_kwargs).heapreplace(0)
+
+
+def test_bounded_min_heap_keeps_k_largest():
+
+    k = 10
+    items = random_items()
+    heap = BoundedMinHeap(k)
+    for i, x in enumerate(items):
+        heap.heappush(x)
+
+        assert len(heap) == min(i + 1, k)
+        assert heap[0] == min(sorted(items[:i + 1])[-k:])
+
+    assert drain(heap) == sorted(items)[-k:]
+
+
+@pytest.mark.parametrize('num_items', [0, 5, 1000])
+def test_bounded_min_heap_heapify(num_items):
+
+    k = 10
+    items = random_items()[:num_items]
+    heap = BoundedMinHeap(k)
+    heap.heapify(items)
+
+    assert len(heap) == min(num_items, k)
+    heap.heappush(-1)
+    assert drain(heap) == sorted(items + [-1])[-k:]
+
+
+@pytest.mark.parametrize('k', [0, -1])
+def test_bounded_min_heap_needs_positive_k(k):
+
+    with pytest.raises(ValueError):
+        BoundedMinHeap(k)
+
+
+def test_merge_drained_heaps():
+
+    min_heaps = []
+    max_heaps = []
+    for seed in range(3):
+        items = random_items(n=100, seed=seed)
+
+        min_heap = MinHeap()
+        min_heap.heapify(items)
+        min_heaps.append(min_heap)
+
+        max_heap = MaxHeap()
+        max_heap.heapify(items)
+        max_heaps.append(max_heap)
+
+    all_items = sorted(x for heap in min_heaps for x in heap.raw())
+
+    assert list(MinHeap.merge(*map(drain, min_heaps))) == all_items
+    assert list(MaxHeap.merge(*map(drain, max_heaps))) == all_items[::-1]
+
+
+def test_merge_with_key():
+
+    sorted_items = [sorted(random_items(n=100, seed=seed), key=str)
+                    for seed in range(3)]
+    all_items = sorted((x for items in sorted_items for x in items), key=str)
+
+    assert list(MinHeap.merge(*sorted_items, key=str)) == all_items
+    assert (list(MaxHeap.merge(*[items[::-1] for items in sorted_items],
+                               key=str)) ==
+            sorted(all_items, key=str, reverse=True))
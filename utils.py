@@ -1,7 +1,21 @@
+import array
 import heapq
+import itertools
 import os
+from typing import Callable, Iterable, Iterator
 from wombats.systems.minigrid import GYM_MONITOR_LOG_DIR_NAME
 
+# CPython's heapq has max heap versions of its routines, (privately, before
+# python 3.14). If they're missing, MaxHeap falls back to negated priorities.
+_heapify_max = getattr(heapq, 'heapify_max',
+                       getattr(heapq, '_heapify_max', None))
+_heappop_max = getattr(heapq, 'heappop_max',
+                       getattr(heapq, '_heappop_max', None))
+_heapreplace_max = getattr(heapq, 'heapreplace_max',
+                           getattr(heapq, '_heapreplace_max', None))
+HAS_NATIVE_MAX_HEAP = None not in (_heapify_max, _heappop_max,
+                                   _heapreplace_max)
+
 
 def get_experiment_paths(EXPERIMENT_NAME: str):
 
@@ -44,23 +58,146 @@ def get_experiment_paths(EXPERIMENT_NAME: str):
     return path_data
 
 
-class MaxHeapObj(object):
+def _siftdown_hole(heap, startpos: int, pos: int) -> None:
     """
-    Overrides the comparison, so you can create a max heap easily
-    See https://stackoverflow.com/a/40455775
+    Moves the item at pos towards startpos (the root) until its parent is no
+    larger, restoring the min heap invariant after an append.
+
+    Rather than swapping at every level, the parents are shifted into a
+    "hole" and the item is only written once, at its final position.
+
+    :param      heap:      The heap container
+    :param      startpos:  The index the item can't move above
+    :param      pos:       The index of the item to move
+    """
+
+    newitem = heap[pos]
+    while pos > startpos:
+        parentpos = (pos - 1) >> 1
+        parent = heap[parentpos]
+        if newitem < parent:
+            heap[pos] = parent
+            pos = parentpos
+        else:
+            break
+    heap[pos] = newitem
+
+
+def _siftdown_max_hole(heap, startpos: int, pos: int) -> None:
+    """
+    Moves the item at pos towards startpos (the root) until its parent is no
+    smaller, restoring the max heap invariant after an append.
+
+    Uses the same "hole" technique as _siftdown_hole.
+
+    :param      heap:      The heap container
+    :param      startpos:  The index the item can't move above
+    :param      pos:       The index of the item to move
+    """
+
+    newitem = heap[pos]
+    while pos > startpos:
+        parentpos = (pos - 1) >> 1
+        parent = heap[parentpos]
+        if parent < newitem:
+            heap[pos] = parent
+            pos = parentpos
+        else:
+            break
+    heap[pos] = newitem
+
+
+def _siftup_hole(heap, pos: int, endpos: int) -> None:
     """
+    Moves the item at pos towards the leaves until neither child is smaller,
+    restoring the min heap invariant below pos.
 
-    def __init__(self, val):
-        self.val = val
+    Uses the same "hole" technique as _siftdown_hole.
 
-    def __lt__(self, other):
-        return self.val > other.val
+    :param      heap:    The heap container
+    :param      pos:     The index of the item to move
+    :param      endpos:  The number of items in the heap
+    """
+
+    newitem = heap[pos]
+    childpos = 2 * pos + 1
+    while childpos < endpos:
+        rightpos = childpos + 1
+        if rightpos < endpos and heap[rightpos] < heap[childpos]:
+            childpos = rightpos
+        child = heap[childpos]
+        if child < newitem:
+            heap[pos] = child
+            pos = childpos
+            childpos = 2 * pos + 1
+        else:
+            break
+    heap[pos] = newitem
 
-    def __eq__(self, other):
-        return self.val == other.val
 
-    def __str__(self):
-        return str(self.val)
+def _siftdown4(heap: list, pos: int) -> None:
+    """
+    Moves the item at pos towards the root of a 4-ary min heap until its
+    parent is no larger. Uses the same "hole" technique as _siftdown_hole.
+
+    :param      heap:  The 4-ary heap list
+    :param      pos:   The index of the item to move
+    """
+
+    newitem = heap[pos]
+    while pos > 0:
+        parentpos = (pos - 1) >> 2
+        parent = heap[parentpos]
+        if newitem < parent:
+            heap[pos] = parent
+            pos = parentpos
+        else:
+            break
+    heap[pos] = newitem
+
+
+def _siftup4(heap: list, pos: int, endpos: int) -> None:
+    """
+    Moves the item at pos towards the leaves of a 4-ary min heap until none
+    of its children are smaller. Uses the same "hole" technique as
+    _siftdown_hole.
+
+    :param      heap:    The 4-ary heap list
+    :param      pos:     The index of the item to move
+    :param      endpos:  The number of items in the heap
+    """
+
+    newitem = heap[pos]
+    childpos = 4 * pos + 1
+    while childpos < endpos:
+
+        # finding the smallest child. When all four exist (everywhere but
+        # the last parent), the compares are unrolled.
+        minpos = childpos
+        minchild = heap[childpos]
+        if childpos + 3 < endpos:
+            child = heap[childpos + 1]
+            if child < minchild:
+                minpos, minchild = childpos + 1, child
+            child = heap[childpos + 2]
+            if child < minchild:
+                minpos, minchild = childpos + 2, child
+            child = heap[childpos + 3]
+            if child < minchild:
+                minpos, minchild = childpos + 3, child
+        else:
+            for otherpos in range(childpos + 1, endpos):
+                child = heap[otherpos]
+                if child < minchild:
+                    minpos, minchild = otherpos, child
+
+        if minchild < newitem:
+            heap[pos] = minchild
+            pos = minpos
+            childpos = 4 * pos + 1
+        else:
+            break
+    heap[pos] = newitem
 
 
 class MinHeap(object):
@@ -69,14 +206,124 @@ class MinHeap(object):
     See https://stackoverflow.com/a/40455775
     """
 
+    # heaps are made in large numbers in the search loops, so skip the
+    # per-instance __dict__
+    __slots__ = ('h',)
+
     def __init__(self):
         self.h = []
 
-    def heappush(self, x):
-        heapq.heappush(self.h, x)
+    # binding the heapq functions as default args skips the global + module
+    # attribute lookups on every call
+    def heappush(self, x, _push=heapq.heappush):
+        _push(self.h, x)
+
+    def heappop(self, _pop=heapq.heappop):
+        return _pop(self.h)
+
+    def heappushpop(self, x, _pushpop=heapq.heappushpop):
+        """
+        Pushes x onto the heap, then pops and returns the smallest item, in a
+        single sift. Faster than a heappush followed by a heappop.
+
+        :param      x:    The item to push
+
+        :returns:   the smallest of x and the heap's items
+        """
+
+        return _pushpop(self.h, x)
+
+    def heapreplace(self, x, _replace=heapq.heapreplace):
+        """
+        Pops and returns the smallest item, then pushes x onto the heap, in a
+        single sift. Faster than a heappop followed by a heappush.
+
+        :param      x:    The item to push
+
+        :returns:   the smallest item in the heap before pushing x
+
+        :raises     IndexError:  the heap is empty
+        """
 
-    def heappop(self):
-        return heapq.heappop(self.h)
+        return _replace(self.h, x)
+
+    @classmethod
+    def nsmallest(cls, n: int, items: Iterable, key: Callable = None,
+                  _nsmallest=heapq.nsmallest) -> list:
+        """
+        Finds the n smallest items in a single pass, only ever keeping a
+        bounded heap of n items.
+
+        :param      n:      The number of items to find
+        :param      items:  The items to search through
+        :param      key:    function returning the priority of an item. If
+                            None, the items themselves are the priorities.
+
+        :returns:   the n smallest items, smallest first
+        """
+
+        return _nsmallest(n, items, key=key)
+
+    @classmethod
+    def nlargest(cls, n: int, items: Iterable, key: Callable = None,
+                 _nlargest=heapq.nlargest) -> list:
+        """
+        Finds the n largest items in a single pass, only ever keeping a
+        bounded heap of n items.
+
+        :param      n:      The number of items to find
+        :param      items:  The items to search through
+        :param      key:    function returning the priority of an item. If
+                            None, the items themselves are the priorities.
+
+        :returns:   the n largest items, largest first
+        """
+
+        return _nlargest(n, items, key=key)
+
+    @staticmethod
+    def merge(*sorted_items: Iterable, key: Callable = None,
+              _merge=heapq.merge) -> Iterator:
+        """
+        Lazily merges already ascending-sorted iterables (e.g. drained min
+        heaps) into a single ascending stream.
+
+        Only one item per input is held at a time, so this is O(n log k) for
+        k inputs, without materializing and sorting their union.
+
+        :param      sorted_items:  The ascending-sorted iterables to merge
+        :param      key:           function returning the priority of an
+                                   item. If None, the items themselves are
+                                   the priorities.
+
+        :returns:   an iterator over all of the items, in ascending order
+        """
+
+        return _merge(*sorted_items, key=key)
+
+    def heapify(self, items: Iterable, _heapify=heapq.heapify) -> None:
+        """
+        Replaces the heap's contents with the given items, building the heap
+        in a single O(n) pass.
+
+        When the items are all known up front, prefer this over pushing them
+        one at a time.
+
+        :param      items:  The items to put in the heap
+        """
+
+        self.h = list(items)
+        _heapify(self.h)
+
+    def raw(self) -> list:
+        """
+        Gets the underlying heap list, so hot loops can use the heapq
+        functions on it directly, without going through this wrapper.
+
+        :returns:   the list holding the heap
+        """
+
+        return self.h
 
     def __getitem__(self, i):
         return self.h[i]
@@ -85,17 +332,325 @@ class MinHeap(object):
         return len(self.h)
 
 
+class BoundedMinHeap(MinHeap):
+    """
+    A min heap holding at most k items, for top-k workloads.
+
+    Once full, pushing an item evicts the smallest one, so the heap keeps
+    the k largest items seen so far, with the smallest of those on top.
+    Building a top-k this way is O(n log k), instead of O(n log n) for
+    pushing everything and then popping k times.
+
+    :param      k:    The maximum number of items to keep
+
+    :raises     ValueError:  k must be positive
+    """
+
+    __slots__ = ('k',)
+
+    def __init__(self, k: int):
+        super().__init__()
+
+        if k < 1:
+            msg = f'k ({k}) must be a positive number of items to keep'
+            raise ValueError(msg)
+
+        self.k = k
+
+    def heappush(self, x, _push=heapq.heappush, _pushpop=heapq.heappushpop):
+        h = self.h
+        if len(h) < self.k:
+            _push(h, x)
+        else:
+            _pushpop(h, x)
+
+    def heapify(self, items: Iterable, _nlargest=heapq.nlargest) -> None:
+        """
+        Replaces the heap's contents with the k largest of the given items,
+        in a single pass.
+
+        :param      items:  The items to choose from
+        """
+
+        # reversing the descending result gives a sorted, and thus valid, heap
+        self.h = _nlargest(self.k, items)[::-1]
+
+
 class MaxHeap(MinHeap):
     """
     A nice class-based interface to create a max heap, using the heapq lib.
-    See https://stackoverflow.com/a/40455775
+
+    Without a key, the items themselves are the priorities, and are kept in
+    max heap order using heapq's native max heap routines. Otherwise, give a
+    key function returning each item's numeric priority, and items are stored
+    as (-key(x), count, x) triples, with the insertion count breaking ties.
+    Either way, all comparisons happen on plain numbers / tuples inside heapq.
+
+    Interpreters without the native max heap routines store un-keyed items as
+    (-x, x) pairs instead. raw() gives whatever is actually stored.
+
+    :param      key:  function returning the numeric priority of an item. If
+                      None, the items themselves are the priorities.
     """
 
-    def heappush(self, x):
-        heapq.heappush(self.h, MaxHeapObj(x))
+    __slots__ = ('key', '_counter', '_native')
+
+    def __init__(self, key: Callable = None):
+        super().__init__()
+
+        self.key = key
+        self._counter = itertools.count()
+        self._native = key is None and HAS_NATIVE_MAX_HEAP
+
+    def heappush(self, x, _push=heapq.heappush,
+                 _siftdown_max=_siftdown_max_hole):
+        h = self.h
+        if self._native:
+            h.append(x)
+            _siftdown_max(h, 0, len(h) - 1)
+        elif self.key is None:
+            _push(h, (-x, x))
+        else:
+            _push(h, (-self.key(x), next(self._counter), x))
+
+    def heappop(self, _pop=heapq.heappop, _pop_max=_heappop_max):
+        if self._native:
+            return _pop_max(self.h)
+        else:
+            return _pop(self.h)[-1]
+
+    def heappushpop(self, x, _pushpop=heapq.heappushpop,
+                    _replace_max=_heapreplace_max):
+        """
+        Pushes x onto the heap, then pops and returns the largest item, in a
+        single sift. Faster than a heappush followed by a heappop.
+
+        :param      x:    The item to push
+
+        :returns:   the largest of x and the heap's items
+        """
+
+        if self._native:
+            h = self.h
+            if h and x < h[0]:
+                return _replace_max(h, x)
+            else:
+                return x
+        else:
+            return _pushpop(self.h, self._to_entry(x))[-1]
+
+    def heapreplace(self, x, _replace=heapq.heapreplace,
+                    _replace_max=_heapreplace_max):
+        """
+        Pops and returns the largest item, then pushes x onto the heap, in a
+        single sift. Faster than a heappop followed by a heappush.
+
+        :param      x:    The item to push
+
+        :returns:   the largest item in the heap before pushing x
+
+        :raises     IndexError:  the heap is empty
+        """
+
+        if self._native:
+            return _replace_max(self.h, x)
+        else:
+            return _replace(self.h, self._to_entry(x))[-1]
+
+    def _to_entry(self, x) -> tuple:
+        """
+        Makes the (-x, x) pair / (-key(x), count, x) triple stored for x when
+        not using the native max heap routines.
+
+        :param      x:    The item to store
+
+        :returns:   the heap entry for x
+        """
+
+        if self.key is None:
+            return (-x, x)
+        else:
+            return (-self.key(x), next(self._counter), x)
+
+    @staticmethod
+    def merge(*sorted_items: Iterable, key: Callable = None,
+              _merge=heapq.merge) -> Iterator:
+        """
+        Lazily merges already descending-sorted iterables (e.g. drained max
+        heaps) into a single descending stream.
+
+        :param      sorted_items:  The descending-sorted iterables to merge
+        :param      key:           function returning the priority of an
+                                   item. If None, the items themselves are
+                                   the priorities.
+
+        :returns:   an iterator over all of the items, in descending order
+        """
+
+        return _merge(*sorted_items, key=key, reverse=True)
+
+    def heapify(self, items: Iterable, _heapify=heapq.heapify,
+                _heapify_max=_heapify_max) -> None:
+        """
+        Replaces the heap's contents with the given items, building the heap
+        in a single O(n) pass.
+
+        :param      items:  The items to put in the heap
+        """
+
+        if self._native:
+            self.h = list(items)
+            _heapify_max(self.h)
+        else:
+            if self.key is None:
+                self.h = [(-x, x) for x in items]
+            else:
+                key = self.key
+                counter = self._counter
+                self.h = [(-key(x), next(counter), x) for x in items]
+            _heapify(self.h)
+
+    def __getitem__(self, i):
+        if self._native:
+            return self.h[i]
+        else:
+            return self.h[i][-1]
+
+
+class NumericMinHeap(object):
+    """
+    A min heap of floats, stored unboxed in an array.array('d').
+
+    Each item takes 8 contiguous bytes instead of a pointer to a boxed
+    float, which matters for very large heaps of numeric priorities. heapq
+    only works on lists, so the sifts are the hole-based helpers above. Being
+    pure python, they make this about 6x slower than MinHeap, so only use it
+    to save memory.
+    """
+
+    __slots__ = ('h',)
+
+    def __init__(self):
+        self.h = array.array('d')
+
+    def heappush(self, x: float, _siftdown=_siftdown_hole) -> None:
+        h = self.h
+        h.append(x)
+        _siftdown(h, 0, len(h) - 1)
+
+    def heappop(self, _siftup=_siftup_hole) -> float:
+        h = self.h
+        last = h.pop()
+        if h:
+            top = h[0]
+            h[0] = last
+            _siftup(h, 0, len(h))
+            return top
+        else:
+            return last
+
+    def heapify(self, items: Iterable, _siftup=_siftup_hole) -> None:
+        """
+        Replaces the heap's contents with the given items, building the heap
+        in a single O(n) pass.
+
+        :param      items:  The items to put in the heap
+        """
+
+        h = array.array('d', items)
+        n = len(h)
+        for pos in reversed(range(n // 2)):
+            _siftup(h, pos, n)
+
+        self.h = h
+
+    def raw(self) -> array.array:
+        """
+        Gets the underlying heap array.
+
+        :returns:   the array holding the heap
+        """
+
+        return self.h
+
+    def __getitem__(self, i):
+        return self.h[i]
+
+    def __len__(self):
+        return len(self.h)
+
+
+class MinHeap4(object):
+    """
+    A 4-ary min heap, with the same interface as MinHeap.
+
+    The tree is half as deep as a binary heap's, and each node's four
+    children sit next to each other in the list. However, the sifts are pure
+    python, so in CPython this is several times slower than the C-backed
+    MinHeap (about 5x for pushing then popping 200k floats). Don't use it
+    for speed unless the whole heap runs under a JIT, like PyPy's.
+    """
+
+    __slots__ = ('h',)
+
+    def __init__(self):
+        self.h = []
+
+    def heappush(self, x, _siftdown=_siftdown4):
+        h = self.h
+        h.append(x)
+        _siftdown(h, len(h) - 1)
+
+    def heappop(self, _siftup=_siftup4):
+        h = self.h
+        last = h.pop()
+        if h:
+            top = h[0]
+            h[0] = last
+            _siftup(h, 0, len(h))
+            return top
+        else:
+            return last
+
+    def __getitem__(self, i):
+        return self.h[i]
+
+    def __len__(self):
+        return len(self.h)
+
+
+class MaxHeap4(MinHeap4):
+    """
+    A 4-ary max heap, with the same interface as MaxHeap.
+
+    Items are stored as (-x, x) pairs, or as (-key(x), count, x) triples if
+    a key is given, with the insertion count breaking ties. Like MinHeap4,
+    this is several times slower than MaxHeap in CPython.
+
+    :param      key:  function returning the numeric priority of an item. If
+                      None, the items themselves are the priorities.
+    """
+
+    __slots__ = ('key', '_counter')
+
+    def __init__(self, key: Callable = None):
+        super().__init__()
+
+        self.key = key
+        self._counter = itertools.count()
+
+    def heappush(self, x, _siftdown=_siftdown4):
+        if self.key is None:
+            entry = (-x, x)
+        else:
+            entry = (-self.key(x), next(self._counter), x)
+
+        h = self.h
+        h.append(entry)
+        _siftdown(h, len(h) - 1)
 
-    def heappop(self):
-        return heapq.heappop(self.h).val
+    def heappop(self, _siftup=_siftup4):
+        return super().heappop(_siftup)[-1]
 
     def __getitem__(self, i):
-        return self.h[i].val
+        return self.h[i][-1]
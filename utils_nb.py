@@ -0,0 +1,160 @@
+import numpy as np
+from wombats.utils import MinHeap
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    # all of the sifts move a "hole" instead of swapping, so each level of
+    # the heap costs one write instead of three
+    @njit(cache=True)
+    def _sift_up(arr: np.ndarray, i: int) -> None:
+        """
+        Moves the item at index i up the heap until its parent is no larger.
+
+        :param      arr:  The heap array
+        :param      i:    The index of the item to move
+        """
+
+        item = arr[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if item < arr[parent]:
+                arr[i] = arr[parent]
+                i = parent
+            else:
+                break
+        arr[i] = item
+
+    @njit(cache=True)
+    def _sift_down(arr: np.ndarray, n: int, i: int) -> None:
+        """
+        Moves the item at index i down the heap until neither child is smaller.
+
+        :param      arr:  The heap array
+        :param      n:    The number of items in the heap
+        :param      i:    The index of the item to move
+        """
+
+        item = arr[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and arr[right] < arr[child]:
+                child = right
+            if arr[child] < item:
+                arr[i] = arr[child]
+                i = child
+                child = 2 * i + 1
+            else:
+                break
+        arr[i] = item
+
+    @njit(cache=True)
+    def _push(arr: np.ndarray, size: int, x: float) -> int:
+        """
+        Pushes x onto the heap. arr must have room for one more item.
+
+        :param      arr:   The heap array
+        :param      size:  The number of items in the heap
+        :param      x:     The item to push
+
+        :returns:   the new number of items in the heap
+        """
+
+        arr[size] = x
+        _sift_up(arr, size)
+
+        return size + 1
+
+    @njit(cache=True)
+    def _pop(arr: np.ndarray, size: int) -> (float, int):
+        """
+        Pops the smallest item off of a non-empty heap.
+
+        :param      arr:   The heap array
+        :param      size:  The number of items in the heap
+
+        :returns:   the smallest item, the new number of items in the heap
+        """
+
+        top = arr[0]
+        size -= 1
+        if size > 0:
+            arr[0] = arr[size]
+            _sift_down(arr, size, 0)
+
+        return top, size
+
+    class NumbaMinHeap(object):
+        """
+        A min heap of floats, with jit-compiled sifts over a numpy array.
+
+        Has the same interface as MinHeap, but only holds numeric priorities.
+        Every push / pop still has to cross from python into the jitted code,
+        so each call is about 1.7x slower than MinHeap's. Only use it when the
+        heap's array is also worked on by other jitted code. If numba isn't
+        installed, this is a plain MinHeap.
+
+        :param      capacity:  The initial number of items the heap can hold
+                               before needing to grow
+        """
+
+        __slots__ = ('arr', 'size')
+
+        def __init__(self, capacity: int = 64):
+
+            self.arr = np.empty(max(capacity, 1), dtype=np.float64)
+            """the heap's items live in the first self.size entries"""
+
+            self.size = 0
+            """the number of items in the heap"""
+
+        # binding the jitted functions as default args skips the global
+        # lookups on every call
+        def heappush(self, x: float, _push=_push) -> None:
+            if self.size == self.arr.size:
+                self.arr = np.resize(self.arr, 2 * self.arr.size)
+
+            self.size = _push(self.arr, self.size, x)
+
+        def heappop(self, _pop=_pop) -> float:
+            if self.size == 0:
+                raise IndexError('pop from empty heap')
+
+            top, self.size = _pop(self.arr, self.size)
+
+            return float(top)
+
+        def __getitem__(self, i: int) -> float:
+            if not -self.size <= i < self.size:
+                raise IndexError('heap index out of range')
+
+            return float(self.arr[i % self.size])
+
+        def __len__(self) -> int:
+            return self.size
+
+else:
+
+    class NumbaMinHeap(MinHeap):
+        """
+        A min heap of floats, with the same interface as MinHeap.
+
+        numba isn't installed, so this is a plain MinHeap standing in for the
+        jit-compiled version. It takes (and ignores) the same capacity
+        argument, so both can be made the same way.
+
+        :param      capacity:  The initial number of items the heap can hold
+                               before needing to grow. Unused here.
+        """
+
+        __slots__ = ()
+
+        def __init__(self, capacity: int = 64):
+            super().__init__()